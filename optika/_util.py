@@ -95,3 +95,28 @@ def angles(
         x=-np.arctan2(direction.x, direction.z).to(u.deg),
         y=-np.arcsin(direction.y / direction.length).to(u.deg),
     )
+
+
+def _key_array(
+    a: float | u.Quantity | na.AbstractScalar,
+) -> None | tuple:
+    """
+    A hashable key identifying the values of the given array,
+    or :obj:`None` if the array is not a plain scalar array.
+
+    The key depends on the values of the array, not on its identity,
+    so modifying the array in-place changes its key.
+
+    Parameters
+    ----------
+    a
+        The array to identify.
+    """
+    a = na.as_named_array(a)
+    if not isinstance(a, na.ScalarArray):
+        return None
+    unit = na.unit(a)
+    value = np.asarray(a.ndarray if unit is None else a.ndarray.value)
+    if value.dtype == object:
+        return None
+    return a.axes, unit, value.shape, value.dtype.str, value.tobytes()
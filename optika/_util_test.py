@@ -46,3 +46,17 @@ def test_angles(direction: na.AbstractCartesian3dVectorArray):
 
     assert isinstance(result, na.AbstractCartesian2dVectorArray)
     assert np.allclose(direction, optika.direction(result))
+
+
+@pytest.mark.parametrize(
+    argnames="a",
+    argvalues=[
+        2,
+        2 * u.mm,
+        na.linspace(0, 1, axis="x", num=5) * u.mm,
+    ],
+)
+def test__key_array(a: float | u.Quantity | na.AbstractScalar):
+    result = optika._util._key_array(a)
+    assert hash(result) == hash(optika._util._key_array(a))
+    assert result != optika._util._key_array(2 * a)
@@ -1,5 +1,6 @@
 import abc
 import re
+import functools
 import pathlib
 import dataclasses
 import numpy as np
@@ -13,6 +14,65 @@ __all__ = [
 ]
 
 
+@functools.lru_cache(maxsize=None)
+def _read_nk(
+    file: pathlib.Path,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load the wavelength, index of refraction, and wavenumber columns of a
+    :cite:t:`Windt1998` file.
+
+    The result is cached since the same files are read many times
+    while fitting the parameters of a multilayer.
+
+    Parameters
+    ----------
+    file
+        The path to the :cite:t:`Windt1998` file to load.
+    """
+    skip_header = 0
+    with open(file, "r") as f:
+        for line in f:
+            if line.startswith(";"):
+                skip_header += 1
+            else:
+                break
+
+    result = np.loadtxt(
+        fname=file,
+        skiprows=skip_header,
+        unpack=True,
+    )
+    result.flags.writeable = False
+
+    return result[0], result[1], result[2]
+
+
+def _key_n(
+    file_nk: na.ScalarArray,
+    wavelength: u.Quantity | na.AbstractScalar,
+) -> None | tuple:
+    """
+    A hashable key identifying the inputs of :meth:`AbstractChemical.n`,
+    or :obj:`None` if the wavelength is not a plain array.
+
+    Parameters
+    ----------
+    file_nk
+        The paths to the files containing the optical constants.
+    wavelength
+        The wavelength at which the index of refraction is evaluated.
+    """
+    key_wavelength = optika._util._key_array(wavelength)
+    if key_wavelength is None:
+        return None
+    return (
+        tuple(file_nk.shape.items()),
+        tuple(np.asarray(file_nk.ndarray).flat),
+        key_wavelength,
+    )
+
+
 @dataclasses.dataclass(eq=False, repr=False)
 class AbstractChemical(
     optika.mixins.Printable,
@@ -22,6 +82,12 @@ class AbstractChemical(
     Interface defining the optical constants for a given chemical.
     """
 
+    _cache_n = None
+    """
+    The key and result of the last call to :meth:`n`,
+    for the same reason the files are cached by :func:`_read_nk`.
+    """
+
     @property
     @abc.abstractmethod
     def formula(self) -> str | na.AbstractScalar:
@@ -106,6 +172,13 @@ class AbstractChemical(
         The complex index of refaction of this chemical for a given wavelength
         """
         file_nk = self.file_nk
+
+        key = _key_n(file_nk, wavelength)
+        if key is not None and self._cache_n is not None:
+            key_cached, result_cached = self._cache_n
+            if key == key_cached:
+                return result_cached.copy()
+
         shape_base = file_nk.shape
 
         shape = na.broadcast_shapes(shape_base, wavelength.shape)
@@ -116,19 +189,7 @@ class AbstractChemical(
         for i, index in enumerate(file_nk.ndindex()):
             file_nk_index = file_nk[index].ndarray
 
-            skip_header = 0
-            with open(file_nk_index, "r") as f:
-                for line in f:
-                    if line.startswith(";"):
-                        skip_header += 1
-                    else:
-                        break
-
-            wavelength_index, n_index, k_index = np.loadtxt(
-                fname=file_nk_index,
-                skiprows=skip_header,
-                unpack=True,
-            )
+            wavelength_index, n_index, k_index = _read_nk(file_nk_index)
 
             wavelength_index = wavelength_index << u.AA
             wavelength_index = na.ScalarArray(wavelength_index, axes="wavelength")
@@ -141,6 +202,9 @@ class AbstractChemical(
                 fp=n_index + 1j * k_index,
             )
 
+        if key is not None:
+            self._cache_n = key, result.copy()
+
         return result
 
     def index_refraction(
@@ -53,6 +53,17 @@ class AbstractTestAbstractChemical(
         assert isinstance(result, na.AbstractScalar)
         assert np.all(result > 0)
 
+    @pytest.mark.parametrize("wavelength", _wavelength)
+    def test_n_cached(
+        self,
+        a: optika.chemicals.AbstractChemical,
+        wavelength: u.Quantity | na.AbstractScalar,
+    ):
+        result = a.n(wavelength)
+        expected = result.copy()
+        result *= 0
+        assert np.all(a.n(wavelength) == expected)
+
     @pytest.mark.parametrize("wavelength", _wavelength)
     def test_wavenumber(
         self,
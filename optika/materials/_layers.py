@@ -258,8 +258,9 @@ class Layer(
             interface=self.interface,
         )
 
-        identity = na.Cartesian2dIdentityMatrixArray()
-        refraction = np.where(where, refraction, identity)
+        if where is not True:
+            identity = na.Cartesian2dIdentityMatrixArray()
+            refraction = np.where(where, refraction, identity)
 
         propagation = matrices.propagation(
             wavelength=wavelength,
@@ -271,7 +272,20 @@ class Layer(
         where_propagation = np.abs(propagation.x.x) < 1e10
         where = where & where_propagation
 
-        transfer = refraction @ propagation
+        # The propagation matrix is diagonal, so the matrix product reduces to
+        # scaling the columns of the refractive matrix.
+        propagation_forward = propagation.x.x
+        propagation_backward = propagation.y.y
+        transfer = na.Cartesian2dMatrixArray(
+            x=na.Cartesian2dVectorArray(
+                x=refraction.x.x * propagation_forward,
+                y=refraction.x.y * propagation_backward,
+            ),
+            y=na.Cartesian2dVectorArray(
+                x=refraction.y.x * propagation_forward,
+                y=refraction.y.y * propagation_backward,
+            ),
+        )
         transfer = np.where(where, transfer, refraction)
 
         return n_internal, direction_internal, transfer, where
@@ -447,9 +461,16 @@ class LayerSequence(AbstractLayerSequence):
 
     @property
     def thickness(self) -> u.Quantity | na.AbstractScalar:
+        thicknesses = [layer.thickness for layer in self.layers]
+        # Converting to a single array costs about as much as summing four
+        # layers one at a time, so it is only faster for longer sequences.
+        if len(thicknesses) > 4 and all(
+            isinstance(t, u.Quantity) and t.isscalar for t in thicknesses
+        ):
+            return u.Quantity(thicknesses, unit=u.nm).sum()
         result = 0 * u.nm
-        for layer in self.layers:
-            result = result + layer.thickness
+        for thickness in thicknesses:
+            result = result + thickness
         return result
 
     @property
@@ -622,9 +643,18 @@ class PeriodicLayerSequence(AbstractLayerSequence):
         na.AbstractScalar,
     ]:
 
-        period = LayerSequence(self.layers)
+        layer_first, *layers_tail = self.layers
+        layers_tail = LayerSequence(layers_tail)
+
+        n, direction, first, where = layer_first.transfer(
+            wavelength=wavelength,
+            direction=direction,
+            polarized_s=polarized_s,
+            n=n,
+            where=where,
+        )
 
-        n, direction, start, where = period.transfer(
+        n, direction, tail, where = layers_tail.transfer(
             wavelength=wavelength,
             direction=direction,
             polarized_s=polarized_s,
@@ -632,7 +662,18 @@ class PeriodicLayerSequence(AbstractLayerSequence):
             where=where,
         )
 
-        n, direction, periodic, where = period.transfer(
+        start = first @ tail
+
+        if self.num_periods == 1:
+            return n, direction, start, where
+
+        # Every period after the first differs from the first period only
+        # in the interface between the top of the previous period
+        # and the first layer, so only the first layer needs to be
+        # recomputed.
+        # Wherever the light did not make it through the first period,
+        # the remaining periods do not contribute.
+        _, _, first, _ = layer_first.transfer(
             wavelength=wavelength,
             direction=direction,
             polarized_s=polarized_s,
@@ -640,6 +681,12 @@ class PeriodicLayerSequence(AbstractLayerSequence):
             where=where,
         )
 
+        periodic = np.where(
+            where,
+            first @ tail,
+            na.Cartesian2dIdentityMatrixArray(),
+        )
+
         periodic = periodic.power(self.num_periods - 1)
 
         return n, direction, start @ periodic, where
@@ -663,12 +710,14 @@ class PeriodicLayerSequence(AbstractLayerSequence):
             **kwargs,
         )
 
+        thickness = layers.thickness
+
         na.plt.brace_vertical(
             x=x,
             width=0.05 * width,
-            beta=1 / (0.02 * layers.thickness),
+            beta=1 / (0.02 * thickness),
             ymin=z,
-            ymax=z + layers.thickness,
+            ymax=z + thickness,
             ax=ax,
             label=rf"$\times {self.num_periods}$",
             kind="left",
@@ -184,13 +184,39 @@ def multilayer_coefficients(
     then the :class:`tuple` :math:`(\vec{r}, \vec{t})` is the quantity returned
     by this function.
     """
+    r, t, _, _ = _multilayer_coefficients(
+        wavelength=wavelength,
+        direction=direction,
+        n=n,
+        layers=layers,
+        substrate=substrate,
+    )
+
+    return r, t
+
+
+def _multilayer_coefficients(
+    wavelength: u.Quantity | na.AbstractScalar,
+    direction: float | na.AbstractScalar = 1,
+    n: float | na.AbstractScalar = 1,
+    layers: Sequence[AbstractLayer] | optika.materials.AbstractLayer = None,
+    substrate: None | Layer = None,
+) -> tuple[
+    optika.vectors.PolarizationVectorArray,
+    optika.vectors.PolarizationVectorArray,
+    float | na.AbstractScalar,
+    na.AbstractScalar,
+]:
+    """
+    Implementation of :func:`multilayer_coefficients` which also returns
+    the index of refraction and the propagation direction inside the substrate,
+    so that they do not need to be recomputed by :func:`multilayer_efficiency`.
+    """
     direction_ambient = direction
     n_ambient = n
 
-    if substrate is not None:
-        substrate = dataclasses.replace(substrate, thickness=0 * u.nm)
-    else:
-        substrate = optika.materials.Layer(thickness=0 * u.nm)
+    if substrate is None:
+        substrate = optika.materials.Layer()
 
     polarized_s = na.ScalarArray(
         ndarray=np.array([True, False]),
@@ -208,12 +234,29 @@ def multilayer_coefficients(
         polarized_s=polarized_s,
         n=n_ambient,
     )
-    n, direction, m_substrate, where = substrate.transfer(
+    # Light is not propagated through the substrate,
+    # so only the refractive matrix of its interface is needed.
+    n_substrate = substrate.n(wavelength)
+
+    direction_substrate = snells_law_scalar(
+        cos_incidence=direction,
+        index_refraction=n,
+        index_refraction_new=n_substrate,
+    )
+
+    m_substrate = matrices.refraction(
         wavelength=wavelength,
-        direction=direction,
+        direction_left=direction,
+        direction_right=direction_substrate,
         polarized_s=polarized_s,
-        n=n,
-        where=where,
+        n_left=n,
+        n_right=n_substrate,
+        interface=substrate.interface,
+    )
+    m_substrate = np.where(
+        where,
+        m_substrate,
+        na.Cartesian2dIdentityMatrixArray(),
     )
     m = m_layers @ m_substrate
 
@@ -234,7 +277,7 @@ def multilayer_coefficients(
         p=t[index_p],
     )
 
-    return r, t
+    return r, t, n_substrate, direction_substrate
 
 
 def multilayer_efficiency(
@@ -485,12 +528,10 @@ def multilayer_efficiency(
     direction_ambient = direction
     n_ambient = n
 
-    if substrate is not None:
-        substrate = dataclasses.replace(substrate, thickness=0 * u.nm)
-    else:
-        substrate = optika.materials.Layer(thickness=0 * u.nm)
+    if substrate is None:
+        substrate = optika.materials.Layer()
 
-    r, t = multilayer_coefficients(
+    r, t, n_substrate, direction_substrate = _multilayer_coefficients(
         wavelength=wavelength,
         direction=direction_ambient,
         n=n_ambient,
@@ -498,13 +539,6 @@ def multilayer_efficiency(
         substrate=substrate,
     )
 
-    n_substrate = substrate.n(wavelength)
-    direction_substrate = snells_law_scalar(
-        cos_incidence=direction_ambient,
-        index_refraction=n_ambient,
-        index_refraction_new=n_substrate,
-    )
-
     impedance_ambient = optika.vectors.PolarizationVectorArray(
         s=n_ambient,
         p=1 / n_ambient,
@@ -632,10 +666,8 @@ def layer_absorbance(
         layers = LayerSequence(layers)
     layers = layers.layer_sequence
 
-    if substrate is not None:
-        substrate = dataclasses.replace(substrate, thickness=0 * u.nm)
-    else:
-        substrate = optika.materials.Layer(thickness=0 * u.nm)
+    if substrate is None:
+        substrate = optika.materials.Layer()
 
     r, t = multilayer_coefficients(
         wavelength=wavelength,
@@ -672,12 +704,14 @@ def layer_absorbance(
         interface=layer.interface,
     )
 
-    n_right, direction_right, m_right, where_right = layers[: index + 1].transfer(
+    n_right, direction_right, m_layer, where_right = layer.transfer(
         wavelength=wavelength,
-        direction=direction,
+        direction=direction_i,
         polarized_s=polarized_s,
-        n=n,
+        n=n_i,
+        where=where_i,
     )
+    m_right = m_i @ m_layer
 
     amplitude_ambient = na.Cartesian2dVectorArray(1, r)
 
@@ -689,35 +723,34 @@ def layer_absorbance(
     a_right, b_right = a_right.x, a_right.y
     a_left, b_left = a_left.x, a_left.y
 
-    angle_right = np.arccos(direction_right)
-    angle_left = np.arccos(direction_left)
-
-    rotation_right = na.Cartesian3dYRotationMatrixArray(angle_right)
-    rotation_left = na.Cartesian3dYRotationMatrixArray(angle_left)
+    # Rotating the unit vectors about the y axis by the propagation angle
+    # only needs the sine and cosine of the angle,
+    # so compute the rotated vectors directly.
+    sin_right = np.sin(np.arccos(direction_right))
+    sin_left = np.sin(np.arccos(direction_left))
 
-    antirotation_right = na.Cartesian3dYRotationMatrixArray(-angle_right)
-    antirotation_left = na.Cartesian3dYRotationMatrixArray(-angle_left)
+    unit_s = na.Cartesian3dVectorArray(0, 1, 0)
 
     a_right = a_right * np.where(
         polarized_s,
-        na.Cartesian3dVectorArray(0, 1, 0),
-        rotation_right @ na.Cartesian3dVectorArray(1, 0, 0),
+        unit_s,
+        na.Cartesian3dVectorArray(direction_right, 0, -sin_right),
     )
     a_left = a_left * np.where(
         polarized_s,
-        na.Cartesian3dVectorArray(0, 1, 0),
-        rotation_left @ na.Cartesian3dVectorArray(1, 0, 0),
+        unit_s,
+        na.Cartesian3dVectorArray(direction_left, 0, -sin_left),
     )
 
     b_right = b_right * np.where(
         polarized_s,
-        na.Cartesian3dVectorArray(0, 1, 0),
-        antirotation_right @ na.Cartesian3dVectorArray(1, 0, 0),
+        unit_s,
+        na.Cartesian3dVectorArray(direction_right, 0, sin_right),
     )
     b_left = b_left * np.where(
         polarized_s,
-        na.Cartesian3dVectorArray(0, 1, 0),
-        antirotation_left @ na.Cartesian3dVectorArray(1, 0, 0),
+        unit_s,
+        na.Cartesian3dVectorArray(direction_left, 0, sin_left),
     )
 
     impedance_ambient = np.where(
@@ -736,10 +769,10 @@ def layer_absorbance(
         1 / n_left,
     )
 
-    ka_right = rotation_right @ na.Cartesian3dVectorArray(0, 0, 1)
-    ka_left = rotation_left @ na.Cartesian3dVectorArray(0, 0, 1)
-    kb_right = antirotation_right @ na.Cartesian3dVectorArray(0, 0, -1)
-    kb_left = antirotation_left @ na.Cartesian3dVectorArray(0, 0, -1)
+    ka_right = na.Cartesian3dVectorArray(sin_right, 0, direction_right)
+    ka_left = na.Cartesian3dVectorArray(sin_left, 0, direction_left)
+    kb_right = na.Cartesian3dVectorArray(sin_right, 0, -direction_right)
+    kb_left = na.Cartesian3dVectorArray(sin_left, 0, -direction_left)
 
     ka_right = impedance_right * ka_right
     ka_left = impedance_left * ka_left
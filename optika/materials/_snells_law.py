@@ -31,9 +31,10 @@ def snells_law_scalar(
     """
     if na.unit(cos_incidence) is not None:
         cos_incidence = cos_incidence.to(u.dimensionless_unscaled).value
-    sin_incidence = np.emath.sqrt(1 - np.square(cos_incidence))
-    sin_transmitted = index_refraction * sin_incidence / index_refraction_new
-    cos_transmitted = np.emath.sqrt(1 - np.square(sin_transmitted))
+    sin2_incidence = 1 - np.square(cos_incidence)
+    ratio = index_refraction / index_refraction_new
+    sin2_transmitted = np.square(ratio) * sin2_incidence
+    cos_transmitted = np.emath.sqrt(1 - sin2_transmitted)
     return cos_transmitted
 
 
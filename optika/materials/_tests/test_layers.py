@@ -126,6 +126,16 @@ class TestLayer(
     pass
 
 
+def test_layer_chemical_reassigned():
+    wavelength = 100 * u.AA
+    a = optika.materials.Layer(chemical="Si", thickness=10 * u.nm)
+    a.n(wavelength)
+    a.chemical = "SiO2"
+    result = a.n(wavelength)
+    expected = optika.chemicals.Chemical("SiO2").n(wavelength)
+    assert np.all(result == expected)
+
+
 class AbstractTestAbstractLayerSequence(
     AbstractTestAbstractLayer,
 ):
@@ -289,3 +299,14 @@ class TestPeriodicLayerSequence(
             assert np.allclose(direction_test, direction_expected)
             assert np.allclose(result_test, result_expected)
             assert np.allclose(where_test, where_expected)
+
+
+def test_periodic_layer_sequence_layers_reassigned():
+    a = optika.materials.PeriodicLayerSequence(
+        layers=[optika.materials.Layer(chemical="Si", thickness=10 * u.nm)],
+        num_periods=2,
+    )
+    assert a.thickness == 20 * u.nm
+    a.layers = [optika.materials.Layer(chemical="Mo", thickness=5 * u.nm)]
+    assert a.thickness == 10 * u.nm
+    assert a._thickness_plot == 5 * u.nm
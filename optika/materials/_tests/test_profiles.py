@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+import scipy.special
 import astropy.units as u
 import named_arrays as na
 import optika
@@ -41,11 +42,11 @@ class AbstractTestAbstractInterfaceProfile(
     )
     @pytest.mark.parametrize(
         argnames="direction_before",
-        argvalues=[1],
+        argvalues=[1, 0],
     )
     @pytest.mark.parametrize(
         argnames="direction_after",
-        argvalues=[1],
+        argvalues=[1, 0],
     )
     @pytest.mark.parametrize("n_before", [1])
     @pytest.mark.parametrize("n_after", [1.5])
@@ -66,8 +67,11 @@ class AbstractTestAbstractInterfaceProfile(
             n_after=n_after,
         )
         assert na.unit_normalized(result).is_equivalent(u.dimensionless_unscaled)
+        assert np.all(np.isfinite(result))
         assert np.all(result >= 0)
         assert np.all(result <= 1)
+        if direction_before == direction_after == 0:
+            assert np.allclose(result, 1)
 
     @pytest.mark.parametrize(
         argnames="wavelength",
@@ -80,6 +84,7 @@ class AbstractTestAbstractInterfaceProfile(
         argnames="direction",
         argvalues=[
             1,
+            0,
             np.cos(na.linspace(-90, 90, axis="angle", num=5) * u.deg),
         ],
     )
@@ -97,8 +102,11 @@ class AbstractTestAbstractInterfaceProfile(
             n=n,
         )
         assert na.unit_normalized(result).is_equivalent(u.dimensionless_unscaled)
+        assert np.all(np.isfinite(result))
         assert np.all(result >= 0)
         assert np.all(result <= 1)
+        if np.all(direction == 0):
+            assert np.allclose(result, 1)
 
 
 @pytest.mark.parametrize(
@@ -110,7 +118,20 @@ class AbstractTestAbstractInterfaceProfile(
 class TestErfInterfaceProfile(
     AbstractTestAbstractInterfaceProfile,
 ):
-    pass
+    @pytest.mark.parametrize(
+        argnames="z",
+        argvalues=[
+            na.linspace(-5, 5, axis="z", num=11) * u.nm,
+        ],
+    )
+    def test__call__vs_erf(
+        self,
+        a: optika.materials.profiles.ErfInterfaceProfile,
+        z: u.Quantity | na.AbstractScalar,
+    ):
+        result = a(z)
+        expected = (1 + scipy.special.erf(z / (np.sqrt(2) * a.width))) / 2
+        assert np.allclose(result, expected, rtol=1e-12, atol=1e-15)
 
 
 @pytest.mark.parametrize(
@@ -170,4 +191,36 @@ class TestLinearInterfaceProfile(
 class TestSinusoidalInterfaceProfile(
     AbstractTestAbstractInterfaceProfile,
 ):
-    pass
+    @pytest.mark.parametrize("n", [1.5])
+    def test_reflectivity_singular(
+        self,
+        a: optika.materials.profiles.SinusoidalInterfaceProfile,
+        n: float,
+    ):
+        # The wavelength at which the argument of the Fourier transform
+        # is pi / 2, the removable singularity of the transform.
+        wavelength = 8 * n * optika.materials.profiles._a_sinusoidal * a.width
+        result = a.reflectivity(
+            wavelength=wavelength,
+            direction=1,
+            n=n,
+        )
+        assert np.all(np.isfinite(result))
+        assert np.allclose(result, np.pi / 4)
+
+    @pytest.mark.parametrize("n_before", [1.5])
+    def test_transmissivity_singular(
+        self,
+        a: optika.materials.profiles.SinusoidalInterfaceProfile,
+        n_before: float,
+    ):
+        wavelength = 4 * n_before * optika.materials.profiles._a_sinusoidal * a.width
+        result = a.transmissivity(
+            wavelength=wavelength,
+            direction_before=1,
+            direction_after=0,
+            n_before=n_before,
+            n_after=1,
+        )
+        assert np.all(np.isfinite(result))
+        assert np.allclose(result, np.pi / 4)
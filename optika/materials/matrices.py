@@ -140,25 +140,24 @@ def refraction(
     q_i = direction_i * impedance_i
     q_j = direction_j * impedance_j
 
-    a_ij = q_i + q_j
-
-    r_ij = (q_i - q_j) / a_ij
-    t_ij = 2 * q_i / a_ij
+    # The Fresnel coefficients share the denominator q_i + q_j,
+    # which cancels in the matrix elements 1 / t_ij and r_ij / t_ij.
+    b_ij = 2 * q_i
+    t_ij_inverse = (q_i + q_j) / b_ij
+    r_ij_t_ij = (q_i - q_j) / b_ij
 
     if interface is not None:
-        r_ij = r_ij * interface.reflectivity(
+        r_ij_t_ij = r_ij_t_ij * interface.reflectivity(
             wavelength=wavelength,
             direction=direction_i,
             n=n_i,
         )
 
     result = na.Cartesian2dMatrixArray(
-        x=na.Cartesian2dVectorArray(1, r_ij),
-        y=na.Cartesian2dVectorArray(r_ij, 1),
+        x=na.Cartesian2dVectorArray(t_ij_inverse, r_ij_t_ij),
+        y=na.Cartesian2dVectorArray(r_ij_t_ij, t_ij_inverse),
     )
 
-    result = result / t_ij
-
     return result
 
 
@@ -239,7 +238,12 @@ def propagation(
     direction of the incident light.
     """
 
-    beta = 2 * np.pi * thickness * n * direction / wavelength
+    thickness_normalized = thickness / wavelength
+    if na.unit(thickness_normalized) is not None:
+        thickness_normalized = thickness_normalized.to(u.dimensionless_unscaled)
+        thickness_normalized = thickness_normalized.value
+
+    beta = 2 * np.pi * thickness_normalized * n * direction
 
     return na.Cartesian2dMatrixArray(
         x=na.Cartesian2dVectorArray(np.exp(-1j * beta), 0),
@@ -14,6 +14,9 @@ __all__ = [
     "SinusoidalInterfaceProfile",
 ]
 
+_a_sinusoidal = np.pi / (np.square(np.pi) - 8)
+"""The ratio of the half-width of the sinusoidal profile to its width."""
+
 
 @dataclasses.dataclass(eq=False, repr=False)
 class AbstractInterfaceProfile(
@@ -93,9 +96,9 @@ class AbstractInterfaceProfile(
         The specular transmission amplitude is given by :cite:t:`Stearns1989`
         Equation 42.
         """
-        k_before = -2 * np.pi * n_before * direction_before / wavelength
-        k_after = -2 * np.pi * n_after * direction_after / wavelength
-        s = np.real(k_after - k_before)
+        q_before = n_before * direction_before
+        q_after = n_after * direction_after
+        s = 2 * np.pi * np.real(q_before - q_after) / wavelength
         return self._derivative_fourier_transform(s)
 
     def reflectivity(
@@ -119,8 +122,7 @@ class AbstractInterfaceProfile(
         normal
             the vector perpendicular to the optical surface
         """
-        k = -2 * np.pi * n * direction / wavelength
-        s = np.real(-2 * k)
+        s = 4 * np.pi * np.real(n * direction) / wavelength
         return self._derivative_fourier_transform(s)
 
 
@@ -209,15 +211,17 @@ class ErfInterfaceProfile(
         )
 
     def __call__(self, z: u.Quantity | na.AbstractScalar) -> na.AbstractScalar:
-        width = self.width
-        x = z / (np.sqrt(2) * width)
-
-        result = (1 + scipy.special.erf(x)) / 2
+        # The error function profile is the cumulative distribution function
+        # of the standard normal distribution, which scipy evaluates in a
+        # single pass.
+        result = scipy.special.ndtr(z / self.width)
 
         return result
 
     def _derivative_fourier_transform(self, s: na.AbstractScalar):
-        return np.exp(-np.square(s * self.width) / 2)
+        # The width is usually a scalar, so square it separately
+        # to save a full-size multiplication.
+        return np.exp(np.square(s) * (-np.square(self.width) / 2))
 
 
 @dataclasses.dataclass(eq=False, repr=False)
@@ -310,8 +314,8 @@ class ExponentialInterfaceProfile(
     def __call__(self, z: u.Quantity | na.AbstractScalar) -> na.AbstractScalar:
         width = self.width
 
-        sgn_z = np.sign(z)
-        result = (1 + sgn_z - sgn_z * np.exp(-sgn_z * np.sqrt(2) * z / width)) / 2
+        a = np.exp(-np.sqrt(2) * np.abs(z) / width)
+        result = (1 + np.copysign(1 - a, z)) / 2
 
         return result
 
@@ -319,7 +323,7 @@ class ExponentialInterfaceProfile(
         self,
         s: na.AbstractScalar,
     ) -> na.AbstractScalar:
-        return 1 / (1 + np.square(s * self.width) / 2)
+        return 1 / (1 + np.square(s) * (np.square(self.width) / 2))
 
 
 @dataclasses.dataclass(eq=False, repr=False)
@@ -415,7 +419,10 @@ class LinearInterfaceProfile(
 
         result = (1 / 2) + z / (2 * np.sqrt(3) * width)
 
-        result = np.minimum(1, np.maximum(result, 0))
+        # Clamp in place since ``result`` is a new array,
+        # and np.clip is not supported by uncertain arrays.
+        result = np.maximum(result, 0, out=result)
+        result = np.minimum(result, 1, out=result)
 
         return result
 
@@ -424,7 +431,16 @@ class LinearInterfaceProfile(
         s: na.AbstractScalar,
     ) -> na.AbstractScalar:
         x = np.sqrt(3) * self.width * s
-        result = np.sin(x.value) / x
+        x = x.to(u.dimensionless_unscaled).value
+        # Use the Taylor series of sin(x) / x close to the origin
+        # to avoid dividing by zero.
+        where_small = np.abs(x) < 1e-3
+        x_safe = np.where(where_small, 1, x)
+        result = np.where(
+            where_small,
+            1 - np.square(x) / 6,
+            np.sin(x_safe) / x_safe,
+        )
         return result
 
 
@@ -521,9 +537,10 @@ class SinusoidalInterfaceProfile(
     def __call__(self, z: u.Quantity | na.AbstractScalar) -> na.AbstractScalar:
         width = self.width
 
-        a = np.pi / (np.square(np.pi) - 8)
-        z = np.minimum(a * width, np.maximum(z, -a * width))
-        result = (1 / 2) + np.sin(np.pi * z / (2 * a * width) * u.rad) / 2
+        limit = _a_sinusoidal * width
+        z = np.maximum(z, -limit)
+        z = np.minimum(z, limit, out=z)
+        result = (1 / 2) + np.sin(np.pi * z / (2 * limit) * u.rad) / 2
 
         return result
 
@@ -531,9 +548,20 @@ class SinusoidalInterfaceProfile(
         self,
         s: na.AbstractScalar,
     ) -> na.AbstractScalar:
-        a = np.pi / (np.square(np.pi) - 8)
+        a = _a_sinusoidal
         x = a * self.width * s
-        x1 = x - np.pi / 2
-        x2 = x + np.pi / 2
-        result = np.pi * (np.sin(x1 * u.rad) / x1 + np.sin(x2 * u.rad) / x2) / 4
+        x = x.to(u.dimensionless_unscaled).value
+        # The sum of the two sinc functions centered on -pi/2 and +pi/2
+        # reduces to a single cosine divided by a quadratic.
+        pi2 = np.square(np.pi)
+        denominator = pi2 - 4 * np.square(x)
+        # Use the limit of the removable singularity at x = +/- pi/2
+        # to avoid dividing by zero.
+        where_singular = np.abs(denominator) < 1e-7
+        denominator_safe = np.where(where_singular, 1, denominator)
+        result = np.where(
+            where_singular,
+            np.pi / 4,
+            pi2 * np.cos(x) / denominator_safe,
+        )
         return result
@@ -1,4 +1,6 @@
 import pytest
+import numpy as np
+import astropy.units as u
 import optika
 from .._materials_test import AbstractTestAbstractStern1994BackilluminatedCCDMaterial
 
@@ -12,4 +14,17 @@ from .._materials_test import AbstractTestAbstractStern1994BackilluminatedCCDMat
 class TestE2VCCD97Material(
     AbstractTestAbstractStern1994BackilluminatedCCDMaterial,
 ):
-    pass
+    def test__quantum_efficiency_fit(
+        self,
+        a: optika.sensors.E2VCCD97Material,
+    ):
+        result = a._quantum_efficiency_fit
+        expected = dict(
+            thickness_oxide=46.109 * u.AA,
+            thickness_implant=1534.89 * u.AA,
+            roughness_substrate=4.7500 * u.nm,
+            cce_backsurface=0.33364 * u.dimensionless_unscaled,
+        )
+        assert result.keys() == expected.keys()
+        for key in expected:
+            assert np.isclose(result[key], expected[key], rtol=1e-3)
@@ -35,6 +35,33 @@ in silicon at room temperature
 """
 
 
+def _as_chemical(
+    chemical: str | optika.chemicals.AbstractChemical,
+) -> optika.chemicals.AbstractChemical:
+    """
+    Convert the given chemical formula into an instance of
+    :class:`optika.chemicals.Chemical`.
+
+    Parameters
+    ----------
+    chemical
+        The chemical formula to convert.
+        If an instance of :class:`optika.chemicals.AbstractChemical`,
+        it is returned unchanged.
+    """
+    if isinstance(chemical, optika.chemicals.AbstractChemical):
+        return chemical
+    return optika.chemicals.Chemical(chemical)
+
+
+_quantum_efficiency_fits: dict[tuple, dict[str, u.Quantity]] = dict()
+"""
+The fitted parameters of each :class:`AbstractStern1994BackilluminatedCCDMaterial`,
+keyed by the measured quantum efficiency so that they are shared between
+instances.
+"""
+
+
 def quantum_yield_ideal(
     wavelength: u.Quantity | na.AbstractScalar,
 ) -> na.AbstractScalar:
@@ -92,13 +119,12 @@ def quantum_yield_ideal(
         ax.set_xlabel(f"wavelength ({wavelength.unit:latex_inline})");
         ax.set_ylabel(f"quantum yield ({qy.unit:latex_inline})");
     """
-    energy = wavelength.to(u.eV, equivalencies=u.spectral())
+    energy = wavelength.to(u.eV, equivalencies=u.spectral()).value
 
-    result = energy / energy_electron_hole
-    result = np.where(energy > energy_electron_hole, result, 1)
-    result = np.where(energy > energy_bandgap, result, 0)
+    result = np.maximum(energy / energy_electron_hole.to_value(u.eV), 1)
+    result *= energy > energy_bandgap.to_value(u.eV)
 
-    return result * u.electron / u.photon
+    return result << (u.electron / u.photon)
 
 
 def absorbance(
@@ -174,11 +200,9 @@ def absorbance(
         ax.set_xlabel(f"wavelength ({wavelength.unit:latex_inline})");
         ax.set_ylabel("incident energy fraction");
     """
-    if not isinstance(chemical_oxide, optika.chemicals.AbstractChemical):
-        chemical_oxide = optika.chemicals.Chemical(chemical_oxide)
+    chemical_oxide = _as_chemical(chemical_oxide)
 
-    if not isinstance(chemical_substrate, optika.chemicals.AbstractChemical):
-        chemical_substrate = optika.chemicals.Chemical(chemical_substrate)
+    chemical_substrate = _as_chemical(chemical_substrate)
 
     result = optika.materials.layer_absorbance(
         index=1,
@@ -206,6 +230,39 @@ def absorbance(
     return np.real(result)
 
 
+def _average_attenuation(
+    z: float | np.ndarray | na.AbstractScalar,
+) -> tuple[
+    float | np.ndarray | na.AbstractScalar,
+    float | np.ndarray | na.AbstractScalar,
+]:
+    r"""
+    Compute :math:`f(z) = (1 - e^{-z}) / z`, the average of :math:`e^{-z'}`
+    over :math:`0 \leq z' \leq z`, and its derivative :math:`f'(z)`.
+
+    Close to the origin, the Taylor series of :math:`f` and :math:`f'`
+    are used to avoid dividing by zero for transparent materials.
+
+    Parameters
+    ----------
+    z
+        The dimensionless optical depth.
+    """
+    where_small = np.abs(z) < 1e-6
+    z_safe = np.where(where_small, 1, z)
+    f = np.where(
+        where_small,
+        1 - z / 2,
+        -np.expm1(-z_safe) / z_safe,
+    )
+    df = np.where(
+        where_small,
+        z / 3 - 1 / 2,
+        (np.exp(-z_safe) - f) / z_safe,
+    )
+    return f, df
+
+
 def charge_collection_efficiency(
     absorption: u.Quantity | na.AbstractScalar,
     thickness_implant: u.Quantity | na.AbstractScalar = 2317 * u.AA,
@@ -335,12 +392,21 @@ def charge_collection_efficiency(
             + \left( \frac{1 - \eta_0}{\alpha W \sec \theta} \right) (1 - e^{-\alpha W \sec \theta})
     """
     z0 = absorption * thickness_implant / np.real(cos_incidence)
-    exp_z0 = np.exp(-z0)
+    unit = na.unit(z0)
+    if unit is not None:
+        z0 = z0.to(u.dimensionless_unscaled).value
+
+    f, _ = _average_attenuation(z0)
 
     term_1 = cce_backsurface
-    term_2 = ((1 - cce_backsurface) / z0) * (1 - exp_z0)
+    term_2 = (1 - cce_backsurface) * f
+
+    result = term_1 + term_2
 
-    return term_1 + term_2
+    if unit is not None and na.unit(result) is None:
+        result = result << u.dimensionless_unscaled
+
+    return result
 
 
 def quantum_efficiency_effective(
@@ -500,11 +566,9 @@ def quantum_efficiency_effective(
     if direction is None:
         direction = na.Cartesian3dVectorArray(0, 0, 1)
 
-    if not isinstance(chemical_oxide, optika.chemicals.AbstractChemical):
-        chemical_oxide = optika.chemicals.Chemical(chemical_oxide)
+    chemical_oxide = _as_chemical(chemical_oxide)
 
-    if not isinstance(chemical_substrate, optika.chemicals.AbstractChemical):
-        chemical_substrate = optika.chemicals.Chemical(chemical_substrate)
+    chemical_substrate = _as_chemical(chemical_substrate)
 
     if normal is None:
         normal = na.Cartesian3dVectorArray(0, 0, -1)
@@ -744,10 +808,15 @@ def electrons_measured(
     d = (2 / 12) * (u.electron / u.photon) ** 2
     f = fano_noise + d * (photons_absorbed - 1 * u.photon) / electrons_expected
     electrons = na.random.poisson(electrons_expected / f) * f
-    e_fractional, e_integral = np.modf(electrons / u.electron)
-    e_random = na.random.binomial(1, e_fractional)
-    electrons_total = e_integral + e_random
-    result = na.random.binomial(electrons_total.astype(int), cce)
+    electrons = electrons / u.electron
+    # Stochastically round to an integer number of electrons.
+    # Adding a uniform random variable and taking the floor rounds up with
+    # a probability equal to the fractional part.
+    # Since the number of electrons is nonnegative, truncating to an integer
+    # is the same as taking the floor.
+    e_random = na.random.uniform(0, 1, shape_random=na.shape(electrons))
+    electrons_total = (electrons + e_random).astype(int)
+    result = na.random.binomial(electrons_total, cce)
     return result * u.electron
 
 
@@ -1022,9 +1091,16 @@ class AbstractBackilluminatedCCDMaterial(
         normal
             The vector perpendicular to the surface of the CCD sensor.
         """
+        return self._absorbance(rays, -rays.direction @ normal)
+
+    def _absorbance(
+        self,
+        rays: optika.rays.AbstractRayVectorArray,
+        cos_incidence: float | na.AbstractScalar,
+    ) -> optika.vectors.PolarizationVectorArray:
         return absorbance(
             wavelength=rays.wavelength,
-            direction=-rays.direction @ normal,
+            direction=cos_incidence,
             n=rays.index_refraction,
             thickness_oxide=self.thickness_oxide,
             thickness_substrate=self.thickness_substrate,
@@ -1050,11 +1126,18 @@ class AbstractBackilluminatedCCDMaterial(
         normal
             The vector perpendicular to the surface of the CCD sensor.
         """
+        return self._charge_collection_efficiency(rays, -rays.direction @ normal)
+
+    def _charge_collection_efficiency(
+        self,
+        rays: optika.rays.AbstractRayVectorArray,
+        cos_incidence: float | na.AbstractScalar,
+    ) -> na.AbstractScalar:
         return charge_collection_efficiency(
             absorption=self._chemical.absorption(rays.wavelength),
             thickness_implant=self.thickness_implant,
             cce_backsurface=self.cce_backsurface,
-            cos_incidence=-rays.direction @ normal,
+            cos_incidence=cos_incidence,
         )
 
     def quantum_efficiency_effective(
@@ -1144,9 +1227,12 @@ class AbstractBackilluminatedCCDMaterial(
             h = astropy.constants.h
             c = astropy.constants.c
             intensity = intensity / (h * c / rays.wavelength) * u.photon
-        absorbance = self.absorbance(rays, normal).average
+        # Project the ray directions onto the surface normal once
+        # and share it between the absorbance and the charge collection efficiency.
+        cos_incidence = -rays.direction @ normal
+        absorbance = self._absorbance(rays, cos_incidence).average
         iqy = self.quantum_yield_ideal(rays.wavelength)
-        cce = self.charge_collection_efficiency(rays, normal)
+        cce = self._charge_collection_efficiency(rays, cos_incidence)
         electrons = electrons_measured(
             photons=intensity,
             absorbance=absorbance,
@@ -1242,51 +1328,181 @@ class AbstractStern1994BackilluminatedCCDMaterial(
     def _quantum_efficiency_fit(self) -> dict[str, float | u.Quantity]:
         qe_measured = self.quantum_efficiency_measured
 
+        # Every instance of a given sensor has the same measured quantum
+        # efficiency, so the fit is only performed once for each measurement.
+        key = (
+            optika._util._key_array(qe_measured.inputs),
+            optika._util._key_array(qe_measured.outputs),
+            optika._util._key_array(self.thickness_substrate),
+            optika._util._key_array(self.roughness_oxide),
+        )
+        if None in key:
+            key = None
+        if key in _quantum_efficiency_fits:
+            result = _quantum_efficiency_fits[key]
+            return {k: v.copy() for k, v in result.items()}
+
         unit_thickness_oxide = u.AA
         unit_thickness_implant = u.AA
         unit_roughness = u.nm
         unit_cce_backsurface = u.dimensionless_unscaled
 
-        def eqe_rms_difference(x: tuple[float, float, float, float]):
+        # The optical properties of the substrate do not depend on the
+        # fit parameters, so the parts of quantum_efficiency_effective()
+        # which only depend on them are computed once, outside the objective.
+        wavelength = qe_measured.inputs
+        direction = 1
+        chemical_oxide = _as_chemical("SiO2")
+        chemical_substrate = _as_chemical("Si")
+        thickness_substrate = self.thickness_substrate
+        roughness_oxide = self.roughness_oxide
+
+        n_substrate = chemical_substrate.n(wavelength)
+        wavenumber_substrate = np.imag(n_substrate)
+        absorption_substrate = 4 * np.pi * wavenumber_substrate / wavelength
+
+        direction_substrate = optika.materials.snells_law_scalar(
+            cos_incidence=direction,
+            index_refraction=1,
+            index_refraction_new=n_substrate,
+        )
+
+        # The implant thickness and the backsurface charge collection
+        # efficiency only enter the analytic charge collection efficiency,
+        # so only the oxide thickness and the substrate roughness
+        # need to be differentiated numerically.
+        absorption_normal = absorption_substrate / np.real(direction_substrate)
+        absorption_normal = absorption_normal.to(1 / unit_thickness_implant).value
+
+        # The residual is flattened for scipy.optimize.least_squares,
+        # so it and its Jacobian are broadcast to a common shape first.
+        shape = na.shape_broadcasted(qe_measured.inputs, qe_measured.outputs)
+
+        def absorbed(
+            thickness_oxide: float,
+            roughness_substrate: float,
+        ) -> na.AbstractScalar:
+            return absorbance(
+                wavelength=wavelength,
+                direction=direction,
+                thickness_oxide=thickness_oxide << unit_thickness_oxide,
+                thickness_substrate=thickness_substrate,
+                chemical_oxide=chemical_oxide,
+                chemical_substrate=chemical_substrate,
+                roughness_oxide=roughness_oxide,
+                roughness_substrate=roughness_substrate << unit_roughness,
+            ).average
+
+        # The Jacobian is evaluated at the same point as the last residual,
+        # so the last evaluation of the model is remembered.
+        @functools.lru_cache(maxsize=1)
+        def model(
+            thickness_oxide: float,
+            thickness_implant: float,
+            roughness_substrate: float,
+            cce_backsurface: float,
+        ) -> tuple[na.AbstractScalar, ...]:
+            absorbance_substrate = absorbed(thickness_oxide, roughness_substrate)
+            z0 = absorption_normal * thickness_implant
+            f, df_dz0 = _average_attenuation(z0)
+            cce = cce_backsurface + (1 - cce_backsurface) * f
+            return absorbance_substrate, f, df_dz0, cce
+
+        def eqe_residual(x: tuple[float, float, float, float]):
+            absorbance_substrate, _, _, cce = model(*x)
+
+            qe_fit = absorbance_substrate * cce
+
+            residual = na.broadcast_to(qe_fit - qe_measured.outputs, shape)
+
+            return residual.ndarray.reshape(-1)
+
+        def eqe_jacobian(x: tuple[float, float, float, float]):
             (
                 thickness_oxide,
                 thickness_implant,
                 roughness_substrate,
                 cce_backsurface,
             ) = x
-            qe_fit = quantum_efficiency_effective(
-                wavelength=qe_measured.inputs,
-                direction=na.Cartesian3dVectorArray(0, 0, 1),
-                thickness_oxide=thickness_oxide << unit_thickness_oxide,
-                thickness_implant=thickness_implant << unit_thickness_implant,
-                thickness_substrate=self.thickness_substrate,
-                roughness_oxide=self.roughness_oxide,
-                roughness_substrate=roughness_substrate << unit_roughness,
-                cce_backsurface=cce_backsurface << unit_cce_backsurface,
+
+            absorbance_substrate, f, df_dz0, cce = model(*x)
+
+            step = np.sqrt(np.finfo(float).eps)
+            step_oxide = step * max(1, abs(thickness_oxide))
+            step_roughness = step * max(1, abs(roughness_substrate))
+
+            absorbance_oxide = absorbed(
+                thickness_oxide + step_oxide,
+                roughness_substrate,
+            )
+            absorbance_roughness = absorbed(
+                thickness_oxide,
+                roughness_substrate + step_roughness,
             )
 
-            return np.sqrt(np.mean(np.square(qe_measured.outputs - qe_fit))).ndarray
+            da_dx0 = (absorbance_oxide - absorbance_substrate) / step_oxide
+            da_dx2 = (absorbance_roughness - absorbance_substrate) / step_roughness
+            dcce_dx1 = (1 - cce_backsurface) * df_dz0 * absorption_normal
+            dcce_dx3 = 1 - f
+
+            jacobian = [
+                da_dx0 * cce,
+                absorbance_substrate * dcce_dx1,
+                da_dx2 * cce,
+                absorbance_substrate * dcce_dx3,
+            ]
+
+            jacobian = [na.broadcast_to(j, shape).ndarray for j in jacobian]
+
+            return np.stack(jacobian, axis=-1).reshape(-1, len(x))
 
-        thickness_oxide_guess = 50 * u.AA
+        thickness_oxide_guess = na.linspace(10, 100, axis="_guess", num=10) * u.AA
         thickness_implant_guess = 2317 * u.AA
         roughness_substrate_guess = 5 * u.nm
         cce_backsurface_guess = 0.21 * u.dimensionless_unscaled
 
-        fit = scipy.optimize.minimize(
-            fun=eqe_rms_difference,
-            x0=[
-                thickness_oxide_guess.to_value(unit_thickness_oxide),
-                thickness_implant_guess.to_value(unit_thickness_implant),
-                roughness_substrate_guess.to_value(unit_roughness),
-                cce_backsurface_guess.to_value(unit_cce_backsurface),
-            ],
-            bounds=[
-                (0, None),
-                (0, None),
-                (0, None),
-                (0, 1),
-            ],
-            method="nelder-mead",
+        # The residual has more than one local minimum as a function of the
+        # oxide thickness, so the residual is evaluated for several oxide
+        # thicknesses at once and the fit is started from the best one.
+        absorbance_guess = absorbance(
+            wavelength=wavelength,
+            direction=direction,
+            thickness_oxide=thickness_oxide_guess,
+            thickness_substrate=thickness_substrate,
+            chemical_oxide=chemical_oxide,
+            chemical_substrate=chemical_substrate,
+            roughness_oxide=roughness_oxide,
+            roughness_substrate=roughness_substrate_guess,
+        )
+        cce_guess = charge_collection_efficiency(
+            absorption=absorption_substrate,
+            thickness_implant=thickness_implant_guess,
+            cce_backsurface=cce_backsurface_guess,
+            cos_incidence=direction_substrate,
+        )
+        qe_guess = absorbance_guess.average * cce_guess
+        residual_guess = qe_guess - qe_measured.outputs
+        axis_cost = tuple(a for a in residual_guess.axes if a != "_guess")
+        cost_guess = np.square(residual_guess).sum(axis=axis_cost)
+        index_guess = np.argmin(cost_guess, axis="_guess")
+        thickness_oxide_guess = thickness_oxide_guess[index_guess].ndarray
+
+        x0 = [
+            thickness_oxide_guess.to_value(unit_thickness_oxide),
+            thickness_implant_guess.to_value(unit_thickness_implant),
+            roughness_substrate_guess.to_value(unit_roughness),
+            cce_backsurface_guess.to_value(unit_cce_backsurface),
+        ]
+        fit = scipy.optimize.least_squares(
+            fun=eqe_residual,
+            x0=x0,
+            jac=eqe_jacobian,
+            bounds=(
+                [0, 0, 0, 0],
+                [np.inf, np.inf, np.inf, 1],
+            ),
+            x_scale=x0,
+            method="trf",
         )
 
         (
@@ -1301,13 +1517,18 @@ class AbstractStern1994BackilluminatedCCDMaterial(
         roughness_substrate = roughness_substrate << unit_roughness
         cce_backsurface = cce_backsurface << unit_cce_backsurface
 
-        return dict(
+        result = dict(
             thickness_oxide=thickness_oxide,
             thickness_implant=thickness_implant,
             roughness_substrate=roughness_substrate,
             cce_backsurface=cce_backsurface,
         )
 
+        if key is not None:
+            _quantum_efficiency_fits[key] = {k: v.copy() for k, v in result.items()}
+
+        return result
+
     @property
     def thickness_oxide(self) -> u.Quantity:
         return self._quantum_efficiency_fit["thickness_oxide"]
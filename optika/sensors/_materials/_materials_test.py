@@ -1,4 +1,5 @@
 import pytest
+import dataclasses
 import numpy as np
 import astropy.units as u
 import named_arrays as na
@@ -76,6 +77,8 @@ def test_absorbance(
     argnames="absorption",
     argvalues=[
         1 / u.mm,
+        0 / u.um,
+        1e-6 / u.um,
     ],
 )
 @pytest.mark.parametrize(
@@ -110,9 +113,37 @@ def test_charge_collection_efficiency(
         cos_incidence=cos_incidence,
     )
 
+    assert na.unit_normalized(result).is_equivalent(u.dimensionless_unscaled)
     assert np.all(result >= 0)
     assert np.all(result <= 1)
 
+    z0 = (absorption * thickness_implant / cos_incidence).to(u.dimensionless_unscaled)
+    if z0 == 0:
+        expected = 1
+    else:
+        expected = cce_backsurface + (1 - cce_backsurface) * -np.expm1(-z0) / z0
+    assert np.allclose(result, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    argnames="z",
+    argvalues=[
+        0,
+        1e-7,
+        0.5,
+        na.geomspace(1e-3, 1e3, axis="z", num=7),
+    ],
+)
+def test__average_attenuation(z: float | na.AbstractScalar):
+    average_attenuation = optika.sensors._materials._materials._average_attenuation
+    f, df = average_attenuation(z)
+    step = 1e-6
+    f_forward, _ = average_attenuation(z + step)
+    f_backward, _ = average_attenuation(z - step)
+    assert np.all(f > 0)
+    assert np.all(f <= 1)
+    assert np.allclose(df, (f_forward - f_backward) / (2 * step), rtol=1e-6)
+
 
 @pytest.mark.parametrize(
     argnames="wavelength",
@@ -340,6 +371,11 @@ class AbstractTestAbstractCCDMaterial(
         result = a.fano_noise
         assert np.all(result > 0 * u.electron / u.photon)
 
+    def test__chemical(self, a: optika.sensors.AbstractCCDMaterial):
+        b = dataclasses.replace(a)
+        assert a._chemical is not b._chemical
+        assert a._chemical_oxide is not b._chemical_oxide
+
 
 class AbstractTestAbstractBackilluminatedCCDMaterial(
     AbstractTestAbstractCCDMaterial,
@@ -530,3 +566,23 @@ class AbstractTestAbstractStern1994BackilluminatedCCDMaterial(
         assert np.all(result.outputs >= 0)
         assert np.all(result.outputs <= 1.1)
         assert np.all(result.inputs >= 0 * u.nm)
+
+    def test__quantum_efficiency_fit_shared(
+        self,
+        a: optika.sensors.AbstractStern1994BackilluminatedCCDMaterial,
+    ):
+        result = a._quantum_efficiency_fit
+        b = dataclasses.replace(a)
+        assert b is not a
+        result_b = b._quantum_efficiency_fit
+        assert result_b is not result
+        for key in result:
+            assert result_b[key] is not result[key]
+            assert np.all(result_b[key] == result[key])
+
+        expected = {k: v.copy() for k, v in result.items()}
+        result_b["thickness_oxide"] *= 0
+        result_b.clear()
+        result_c = dataclasses.replace(a)._quantum_efficiency_fit
+        for key in expected:
+            assert np.all(result_c[key] == expected[key])
@@ -1,5 +1,5 @@
 import pathlib
-import matplotlib.pyplot as plt
+import numpy as np
 import pymupdf
 import named_arrays as na
 
@@ -60,10 +60,8 @@ def airforce(
 
     pix = page.get_pixmap(matrix=mat)
 
-    fn = "tmp.png"
-    pix.save(fn)
-
-    img = plt.imread(fn)
+    img = np.frombuffer(pix.samples, dtype=np.uint8)
+    img = img.reshape(pix.height, pix.width, pix.n)
 
     img = img.astype(float)[::-1].sum(~0)
 